@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import typing
+import shutil
+
 import pandas as pd
+import pyarrow, pyarrow.csv
 
 from .reseng.util import download_file
 from .reseng.nbd import Nbd
@@ -19,6 +23,80 @@ PATH = {
     'ruca_doc': nbd.root / 'data/ers_rurality/ruca_doc.txt'
 }
 
+def _read_combined_csv(path, col_types):
+    """Read combined CSV file into `pandas.DataFrame`, parsing all columns in a single pass.
+    `col_types` maps every column name to its pyarrow type."""
+    opts = pyarrow.csv.ConvertOptions(column_types=col_types, strings_can_be_null=True)
+    return pyarrow.csv.read_csv(path, convert_options=opts).to_pandas()
+
+def _load_year(spec, src_dir):
+    """Download and read data and documentation of a single year.
+    `spec` is a dict with keys:
+    - 'name': title of documentation section.
+    - 'url': source spreadsheet.
+    - 'read': optional extra `pd.read_excel()` arguments for data sheet.
+    - 'cols_map': source to renamed column names, only these columns are read.
+    - 'static': constant columns to add.
+    - 'doc': optional list of (label, `pd.read_excel()` arguments) for documentation sheets.
+    Return tuple of data and documentation dataframes.
+    """
+    fname = download_file(spec['url'], src_dir)
+    cols_map = spec['cols_map']
+    df = pd.read_excel(fname, dtype='str', usecols=list(cols_map), **spec.get('read', {}))
+    df = df.rename(columns=cols_map)
+    for col, val in spec['static'].items():
+        df[col] = val
+
+    doc = [pd.DataFrame([f"{spec['name']} documentation", '-' * 80, f"Data source: {spec['url']}"]),
+           pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
+           pd.DataFrame([[v, k] for k, v in cols_map.items()])]
+    for label, kwargs in spec.get('doc', []):
+        doc.append(pd.DataFrame([''] if label is None else ['', label]))
+        doc.append(pd.read_excel(fname, header=None, dtype='str', **kwargs).dropna(axis=1, how='all'))
+    return df, pd.concat(doc)
+
+def _combine_years(specs, src_dir, cols):
+    """Load all years in `specs` and stack them into single data and documentation dataframes.
+    Data is reindexed to `cols`. String values are stripped of whitespace."""
+    dfs = []
+    doc_dfs = []
+    for spec in specs:
+        df, doc = _load_year(spec, src_dir)
+        dfs.append(df.reindex(columns=cols, copy=False))
+        if doc_dfs:
+            doc_dfs.append(pd.DataFrame(['', '']))
+        doc_dfs.append(doc)
+
+    df = pd.concat(dfs, ignore_index=True, copy=False)
+    for col in df:
+        df[col] = df[col].str.strip()
+    doc = pd.concat(doc_dfs)
+    for col in doc:
+        doc[col] = doc[col].str.strip()
+    return df, doc
+
+def _save_combined(df, doc, path, doc_path):
+    """Save combined data as CSV and documentation as tab-separated TXT."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # pyarrow quotes header and all string fields, unlike DataFrame.to_csv, values read back the same
+    pyarrow.csv.write_csv(pyarrow.Table.from_pandas(df, preserve_index=False), path)
+    print(f'Saved combined data to "{path}".')
+    doc.to_csv(doc_path, '\t', header=False, index=False)
+    print(f'Saved documentation to "{doc_path}".')
+
+
+_RUC_COL_TYPES = {
+    'FIPS': pyarrow.string(),
+    'STATE': pyarrow.string(),
+    'COUNTY': pyarrow.string(),
+    'RUC_YEAR': pyarrow.int64(),
+    'RUC_CODE': pyarrow.string(),
+    'RUC_CODE_DESCRIPTION': pyarrow.string(),
+    'POPULATION_YEAR': pyarrow.float64(),
+    'POPULATION': pyarrow.float64(),
+    'PERCENT_NONMETRO_COMMUTERS': pyarrow.float64()
+}
+_RUC_CATS = pd.CategoricalDtype(['0', '1', '2', '3', '4', '5', '6', '7', '8', '9'], ordered=True)
 
 def get_ruc_df():
     """Return `pandas.DataFrame` of Rural-Urban Continuum codes for all years."""
@@ -26,153 +104,82 @@ def get_ruc_df():
     if not path.exists():
         print(f'RUC data not found at "{path}", attempting to download and construct...')
         download_and_combine_ruc()
-    df = pd.read_csv(path, dtype='str')
-    for c in ['RUC_YEAR', 'POPULATION_YEAR', 'POPULATION', 'PERCENT_NONMETRO_COMMUTERS']:
-        df[c] = pd.to_numeric(df[c])
-    cats = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
-    df['RUC_CODE'] = pd.Categorical(df['RUC_CODE'], cats, True)
+    df = _read_combined_csv(path, _RUC_COL_TYPES)
+    df['RUC_CODE'] = df['RUC_CODE'].astype(_RUC_CATS)
     return df
 
+# Year specifications, see `_load_year()`.
+# 1993 file is contained within 1983-1993 file. 2003 file repeats 1993 column.
+_RUC_SPECS = [
+    {
+        'name': 'RUC 1974',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53251/ruralurbancodes1974.xls?v=9631.3',
+        'read': {'nrows': 3141},
+        'cols_map': {'FIPS Code': 'FIPS', 'State': 'STATE', 'County Name': 'COUNTY', '1974 Rural-urban Continuum Code': 'RUC_CODE'},
+        'static': {'RUC_YEAR': '1974'},
+        'doc': [(None, {'skiprows': 3143})]
+    },
+    {
+        'name': 'RUC 1983',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53251/cd8393.xls?v=9631.3',
+        'cols_map': {'FIPS': 'FIPS', 'State': 'STATE', 'County Name': 'COUNTY', '1983 Rural-urban Continuum Code': 'RUC_CODE'},
+        'static': {'RUC_YEAR': '1983'}
+    },
+    {
+        'name': 'RUC 1993',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53251/cd8393.xls?v=9631.3',
+        'cols_map': {'FIPS': 'FIPS', 'State': 'STATE', 'County Name': 'COUNTY', '1993 Rural-urban Continuum Code': 'RUC_CODE'},
+        'static': {'RUC_YEAR': '1993'}
+    },
+    {
+        'name': 'RUC 2003',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53251/ruralurbancodes2003.xls?v=9631.3',
+        'cols_map': {'FIPS Code': 'FIPS', 'State': 'STATE', 'County Name': 'COUNTY',
+                     '2003 Rural-urban Continuum Code': 'RUC_CODE', '2000 Population ': 'POPULATION',
+                     'Percent of workers in nonmetro counties commuting to central counties of adjacent metro areas': 'PERCENT_NONMETRO_COMMUTERS',
+                     'Description for 2003 codes': 'RUC_CODE_DESCRIPTION'},
+        'static': {'RUC_YEAR': '2003', 'POPULATION_YEAR': '2000'}
+    },
+    {
+        'name': 'RUC Puerto Rico 2003',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53251/pr2003.xls?v=9631.3',
+        'cols_map': {'FIPS Code': 'FIPS', 'State': 'STATE', 'Municipio Name': 'COUNTY', 'Population 2003 ': 'POPULATION',
+                     'Rural-urban Continuum Code, 2003': 'RUC_CODE', 'Description of the 2003 Code': 'RUC_CODE_DESCRIPTION'},
+        'static': {'RUC_YEAR': '2003', 'POPULATION_YEAR': '2003'}
+    },
+    {
+        'name': 'RUC 2013',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53251/ruralurbancodes2013.xls?v=9631.3',
+        'read': {'sheet_name': 'Rural-urban Continuum Code 2013'},
+        'cols_map': {'FIPS': 'FIPS', 'State': 'STATE', 'County_Name': 'COUNTY', 'Population_2010': 'POPULATION',
+                     'RUCC_2013': 'RUC_CODE', 'Description': 'RUC_CODE_DESCRIPTION'},
+        'static': {'RUC_YEAR': '2013', 'POPULATION_YEAR': '2010'},
+        'doc': [(None, {'sheet_name': 'Documentation'})]
+    }
+]
+
 def download_and_combine_ruc():
     """Download Rural-Urban Continuum codes and documentation.
     Combine all years of data into single CSV file.
     Save all documentation into single TXT file.
     """
-    path = PATH['ruc']
-    path.parent.mkdir(parents=True, exist_ok=True)
-    ruc_src = PATH['source'] / 'ruc'
-    ruc_dfs = []
-    ruc_doc_dfs = []
-
-    # 1974
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53251/ruralurbancodes1974.xls?v=9631.3'
-    fname = download_file(url, ruc_src)
-    df = pd.read_excel(fname, dtype='str', nrows=3141)
-    cols_map = {'FIPS Code': 'FIPS', 'State': 'STATE', 'County Name': 'COUNTY', '1974 Rural-urban Continuum Code': 'RUC_CODE'}
-    df = df.rename(columns=cols_map)
-    df['RUC_YEAR'] = '1974'
-    ruc_dfs.append(df)
-
-    df = pd.concat([
-        pd.DataFrame(['RUC 1974 documentation', '-' * 80, f'Data source: {url}']),
-        pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-        pd.DataFrame([[v, k] for k, v in cols_map.items()]),
-        pd.DataFrame(['']),
-        pd.read_excel(fname, dtype='str', skiprows=3143, header=None).dropna(axis=1, how='all')])
-    ruc_doc_dfs.append(df)
-
-
-    # 1983
-    # 1993 file is contained within 1983-1993 file. 2003 file repeats 1993 column.
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53251/cd8393.xls?v=9631.3'
-    fname = download_file(url, ruc_src)
-
-    df = pd.read_excel(fname, dtype='str')
-    cols_map = {'FIPS': 'FIPS', 'State': 'STATE', 'County Name': 'COUNTY', '1983 Rural-urban Continuum Code': 'RUC_CODE'}
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['RUC_YEAR'] = '1983'
-    ruc_dfs.append(df)
-
-    df = pd.concat([
-        pd.DataFrame(['RUC 1983 documentation', '-' * 80, f'Data source: {url}']),
-        pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-        pd.DataFrame([[v, k] for k, v in cols_map.items()])])
-    ruc_doc_dfs.extend([pd.DataFrame(['', '']), df])
-
-
-    # 1993
-    df = pd.read_excel(fname, dtype='str')
-    cols_map = {'FIPS': 'FIPS', 'State': 'STATE', 'County Name': 'COUNTY', '1993 Rural-urban Continuum Code': 'RUC_CODE'}
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['RUC_YEAR'] = '1993'
-    ruc_dfs.append(df)
-
-    df = pd.concat([
-        pd.DataFrame(['RUC 1993 documentation', '-' * 80, f'Data source: {url}']),
-        pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-        pd.DataFrame([[v, k] for k, v in cols_map.items()])])
-    ruc_doc_dfs.extend([pd.DataFrame(['', '']), df])
-
-
-    # 2003
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53251/ruralurbancodes2003.xls?v=9631.3'
-    fname = download_file(url, ruc_src)
-    df = pd.read_excel(fname, dtype='str')
-    cols_map = {'FIPS Code': 'FIPS', 'State': 'STATE', 'County Name': 'COUNTY',
-                '2003 Rural-urban Continuum Code': 'RUC_CODE', '2000 Population ': 'POPULATION',
-                'Percent of workers in nonmetro counties commuting to central counties of adjacent metro areas': 'PERCENT_NONMETRO_COMMUTERS',
-                'Description for 2003 codes': 'RUC_CODE_DESCRIPTION'}
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['RUC_YEAR'] = '2003'
-    df['POPULATION_YEAR'] = '2000'
-    ruc_dfs.append(df)
-
-    df = pd.concat([
-        pd.DataFrame(['RUC 2003 documentation', '-' * 80, f'Data source: {url}']),
-        pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-        pd.DataFrame([[v, k] for k, v in cols_map.items()])])
-    ruc_doc_dfs.extend([pd.DataFrame(['', '']), df])
-
-
-    # Puerto Rico 2003
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53251/pr2003.xls?v=9631.3'
-    fname = download_file(url, ruc_src)
-    df = pd.read_excel(fname, dtype='str')
-
-    cols_map = {'FIPS Code': 'FIPS', 'State': 'STATE', 'Municipio Name': 'COUNTY', 'Population 2003 ': 'POPULATION',
-                'Rural-urban Continuum Code, 2003': 'RUC_CODE', 'Description of the 2003 Code': 'RUC_CODE_DESCRIPTION'}
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['RUC_YEAR'] = '2003'
-    df['POPULATION_YEAR'] = '2003'
-    ruc_dfs.append(df)
-
-    df = pd.concat([
-        pd.DataFrame(['RUC Puerto Rico 2003 documentation', '-' * 80, f'Data source: {url}']),
-        pd.DataFrame([['Column names'], ['Renamed', 'Original']]),
-        pd.DataFrame([[v, k] for k, v in cols_map.items()])])
-    ruc_doc_dfs.extend([pd.DataFrame(['', '']), df])
-
-
-    # 2013
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53251/ruralurbancodes2013.xls?v=9631.3'
-    fname = download_file(url, ruc_src)
-    df = pd.read_excel(fname, 'Rural-urban Continuum Code 2013', dtype='str')
-    cols_map = {'FIPS': 'FIPS', 'State': 'STATE', 'County_Name': 'COUNTY', 'Population_2010': 'POPULATION',
-                'RUCC_2013': 'RUC_CODE', 'Description': 'RUC_CODE_DESCRIPTION'}
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['RUC_YEAR'] = '2013'
-    df['POPULATION_YEAR'] = '2010'
-    ruc_dfs.append(df)
-
-    df = pd.concat([pd.DataFrame(['RUC 2013 documentation', '-' * 80, f'Data source: {url}']),
-                    pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-                    pd.DataFrame([[v, k] for k, v in cols_map.items()]),
-                    pd.DataFrame(['']),
-                    pd.read_excel(fname, 'Documentation', header=None, dtype='str')])
-    ruc_doc_dfs.extend([pd.DataFrame(['', '']), df])
-
-    # Combine and save to disk
-    df = pd.concat(ruc_dfs)
-    df = df[['FIPS', 'STATE', 'COUNTY', 'RUC_YEAR', 'RUC_CODE', 'RUC_CODE_DESCRIPTION', 
-             'POPULATION_YEAR', 'POPULATION', 'PERCENT_NONMETRO_COMMUTERS']]
-    for col in df:
-        df[col] = df[col].str.strip()
-    df = df.sort_values(['FIPS', 'RUC_YEAR'])
-    df.to_csv(path, index=False)
-    print(f'Saved combined data to "{path}".')
-
-    df = pd.concat(ruc_doc_dfs)
-    for col in df:
-        df[col] = df[col].str.strip()
-    p = PATH['ruc_doc']
-    df.to_csv(p, '\t', header=False, index=False)
-    print(f'Saved documentation to "{p}".')
-
+    df, doc = _combine_years(_RUC_SPECS, PATH['source'] / 'ruc', list(_RUC_COL_TYPES))
+    df.sort_values(['FIPS', 'RUC_YEAR'], inplace=True, kind='stable')
+    _save_combined(df, doc, PATH['ruc'], PATH['ruc_doc'])
+
+
+_UI_COL_TYPES = {
+    'FIPS': pyarrow.string(),
+    'STATE': pyarrow.string(),
+    'COUNTY': pyarrow.string(),
+    'UI_YEAR': pyarrow.int64(),
+    'UI_CODE': pyarrow.string(),
+    'UI_CODE_DESCRIPTION': pyarrow.string(),
+    'POPULATION_YEAR': pyarrow.int64(),
+    'POPULATION': pyarrow.float64(),
+    'POPULATION_DENSITY': pyarrow.float64()
+}
+_UI_CATS = pd.CategoricalDtype(['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12'], ordered=True)
 
 def get_ui_df():
     """Return `pandas.DataFrame` of Urban Influence codes for all years."""
@@ -180,119 +187,83 @@ def get_ui_df():
     if not path.exists():
         print(f'UI data not found at "{path}", attempting to download and construct...')
         download_and_combine_ui()
-    df = pd.read_csv(path, dtype='str')
-    for c in ['UI_YEAR', 'POPULATION_YEAR', 'POPULATION', 'POPULATION_DENSITY']:
-        df[c] = pd.to_numeric(df[c])
-    cats = ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12']
-    df['UI_CODE'] = pd.Categorical(df['UI_CODE'], cats, True)
+    df = _read_combined_csv(path, _UI_COL_TYPES)
+    df['UI_CODE'] = df['UI_CODE'].astype(_UI_CATS)
     return df
 
+# Year specifications, see `_load_year()`.
+_UI_SPECS = [
+    {
+        'name': 'UI 1993',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53797/UrbanInfluenceCodes.xls?v=1904.3',
+        'read': {'sheet_name': 'Urban Influence Codes'},
+        'cols_map': {'FIPS Code': 'FIPS', 'State': 'STATE', 'County name': 'COUNTY',
+                     '2000 Population': 'POPULATION', '2000 Persons per square mile': 'POPULATION_DENSITY',
+                     '1993 Urban Influence Code': 'UI_CODE', '1993 Urban Influence Code description': 'UI_CODE_DESCRIPTION'},
+        'static': {'UI_YEAR': '1993', 'POPULATION_YEAR': '2000'},
+        'doc': [(None, {'sheet_name': 'Information', 'skiprows': 18})]
+    },
+    {
+        'name': 'UI 2003',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53797/UrbanInfluenceCodes.xls?v=1904.3',
+        'read': {'sheet_name': 'Urban Influence Codes'},
+        'cols_map': {'FIPS Code': 'FIPS', 'State': 'STATE', 'County name': 'COUNTY',
+                     '2003 Urban Influence Code': 'UI_CODE', '2003 Urban Influence Code description': 'UI_CODE_DESCRIPTION',
+                     '2000 Population': 'POPULATION', '2000 Persons per square mile': 'POPULATION_DENSITY'},
+        'static': {'UI_YEAR': '2003', 'POPULATION_YEAR': '2000'},
+        'doc': [(None, {'sheet_name': 'Information', 'skiprows': 3, 'nrows': 14})]
+    },
+    {
+        'name': 'UI Puerto Rico 2003',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53797/pr2003UrbInf.xls?v=1904.3',
+        'cols_map': {'FIPS Code': 'FIPS', 'State': 'STATE', 'Municipio Name': 'COUNTY', 'Population 2003 ': 'POPULATION',
+                     'Urban Influence  Code, 2003': 'UI_CODE', 'Description of the 2003 Code': 'UI_CODE_DESCRIPTION'},
+        'static': {'UI_YEAR': '2003', 'POPULATION_YEAR': '2003'}
+    },
+    {
+        'name': 'UI 2013',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53797/UrbanInfluenceCodes2013.xls?v=1904.3',
+        'read': {'sheet_name': 'Urban Influence Codes 2013'},
+        'cols_map': {'FIPS': 'FIPS', 'State': 'STATE', 'County_Name': 'COUNTY', 'Population_2010': 'POPULATION',
+                     'UIC_2013': 'UI_CODE', 'Description': 'UI_CODE_DESCRIPTION'},
+        'static': {'UI_YEAR': '2013', 'POPULATION_YEAR': '2010'},
+        'doc': [(None, {'sheet_name': 'Documentation'})]
+    }
+]
+
 def download_and_combine_ui():
     """Download Urban Influence codes and documentation.
     Combine all years of data into single CSV file.
     Save all documentation into single TXT file.
     """
-    path = PATH['ui']
-    path.parent.mkdir(parents=True, exist_ok=True)
-    ui_src = PATH['source'] / 'ui'
-    ui_dfs = []
-    ui_doc_dfs = []
-
-    # 1993
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53797/UrbanInfluenceCodes.xls?v=1904.3'
-    fpath = download_file(url, ui_src)
-
-    df = pd.read_excel(fpath, 'Urban Influence Codes', dtype='str')
-    cols_map = {'FIPS Code': 'FIPS', 'State': 'STATE', 'County name': 'COUNTY',
-                '2000 Population': 'POPULATION', '2000 Persons per square mile': 'POPULATION_DENSITY',
-                '1993 Urban Influence Code': 'UI_CODE', '1993 Urban Influence Code description': 'UI_CODE_DESCRIPTION'}
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['UI_YEAR'] = '1993'
-    df['POPULATION_YEAR'] = '2000'
-    ui_dfs.append(df)
-
-    df = pd.concat([pd.DataFrame(['UI 1993 documentation', '-' * 80, f'Data source: {url}']),
-                    pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-                    pd.DataFrame([[v, k] for k, v in cols_map.items()]),
-                    pd.DataFrame(['']),
-                    pd.read_excel(fpath, 'Information', header=None, dtype='str', skiprows=18)])
-
-    ui_doc_dfs.append(df)
-
-    # 2003
-    df = pd.read_excel(fpath, 'Urban Influence Codes', dtype='str')
-    cols_map = {'FIPS Code': 'FIPS', 'State': 'STATE', 'County name': 'COUNTY',
-                '2003 Urban Influence Code': 'UI_CODE', '2003 Urban Influence Code description': 'UI_CODE_DESCRIPTION',
-                '2000 Population': 'POPULATION', '2000 Persons per square mile': 'POPULATION_DENSITY'}
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['UI_YEAR'] = '2003'
-    df['POPULATION_YEAR'] = '2000'
-    ui_dfs.append(df)
-
-    df = pd.concat([pd.DataFrame(['UI 2003 documentation', '-' * 80, f'Data source: {url}']),
-                    pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-                    pd.DataFrame([[v, k] for k, v in cols_map.items()]),
-                    pd.DataFrame(['']),
-                    pd.read_excel(fpath, 'Information', header=None, dtype='str', skiprows=3, nrows=14)])
-    ui_doc_dfs.extend([pd.DataFrame(['', '']), df])
-
-    # Puerto Rico 2003
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53797/pr2003UrbInf.xls?v=1904.3'
-    fpath = download_file(url, ui_src)
-
-    df = pd.read_excel(fpath, dtype='str')
-    cols_map = {'FIPS Code': 'FIPS', 'State': 'STATE', 'Municipio Name': 'COUNTY', 'Population 2003 ': 'POPULATION',
-                'Urban Influence  Code, 2003': 'UI_CODE', 'Description of the 2003 Code': 'UI_CODE_DESCRIPTION'}
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['UI_YEAR'] = '2003'
-    df['POPULATION_YEAR'] = '2003'
-    ui_dfs.append(df)
-
-    df = pd.concat([pd.DataFrame(['UI Puerto Rico 2003 documentation', '-' * 80, f'Data source: {url}']),
-                    pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-                    pd.DataFrame([[v, k] for k, v in cols_map.items()])])
-    ui_doc_dfs.extend([pd.DataFrame(['', '']), df])
-
-    # 2013
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53797/UrbanInfluenceCodes2013.xls?v=1904.3'
-    fpath = download_file(url, ui_src)
-
-    df = pd.read_excel(fpath, 'Urban Influence Codes 2013', dtype='str')
-    cols_map = {'FIPS': 'FIPS', 'State': 'STATE', 'County_Name': 'COUNTY', 'Population_2010': 'POPULATION',
-                'UIC_2013': 'UI_CODE', 'Description': 'UI_CODE_DESCRIPTION'}
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['UI_YEAR'] = '2013'
-    df['POPULATION_YEAR'] = '2010'
-    ui_dfs.append(df)
-
-    df = pd.concat([pd.DataFrame(['UI 2013 documentation', '-' * 80, f'Data source: {url}']),
-                    pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-                    pd.DataFrame([[v, k] for k, v in cols_map.items()]),
-                    pd.DataFrame(['']),
-                    pd.read_excel(fpath, 'Documentation', header=None, dtype='str')])
-    ui_doc_dfs.extend([pd.DataFrame(['', '']), df])
-
-    # Combine and save to disk
-    df = pd.concat(ui_dfs)
-    df = df[['FIPS', 'STATE', 'COUNTY', 'UI_YEAR', 'UI_CODE', 'UI_CODE_DESCRIPTION', 
-             'POPULATION_YEAR', 'POPULATION', 'POPULATION_DENSITY']]
-    for col in df:
-        df[col] = df[col].str.strip()
-    df = df.sort_values(['FIPS', 'UI_YEAR'])
-    df.to_csv(path, index=False)
-    print(f'Saved combined data to "{path}".')
-
-    df = pd.concat(ui_doc_dfs)
-    for col in df:
-        df[col] = df[col].str.strip()
-    p = PATH['ui_doc']
-    df.to_csv(p, '\t', header=False, index=False)
-    print(f'Saved documentation to "{p}".')
-
+    df, doc = _combine_years(_UI_SPECS, PATH['source'] / 'ui', list(_UI_COL_TYPES))
+    df.sort_values(['FIPS', 'UI_YEAR'], inplace=True, kind='stable')
+    _save_combined(df, doc, PATH['ui'], PATH['ui_doc'])
+
+
+# POPULATION and AREA are read as strings and coerced to numbers after load, see `get_ruca_df()`
+_RUCA_COL_TYPES = {
+    'FIPS': pyarrow.string(),
+    'STATE': pyarrow.string(),
+    'COUNTY': pyarrow.string(),
+    'YEAR': pyarrow.int64(),
+    'RUCA_CODE': pyarrow.string(),
+    'POPULATION': pyarrow.string(),
+    'AREA': pyarrow.string(),
+    'METRO': pyarrow.string()
+}
+_RUCA_CATS = pd.CategoricalDtype(['1', '1.1', 
+                                  '2', '2.1', '2.2', 
+                                  '3', 
+                                  '4', '4.1', '4.2', 
+                                  '5', '5.1', '5.2', 
+                                  '6', '6.1', 
+                                  '7', '7.1', '7.2', '7.3', '7.4', 
+                                  '8', '8.1', '8.2', '8.3', '8.4', 
+                                  '9', '9.1', '9.2', 
+                                  '10', '10.1', '10.2', '10.3', '10.4', '10.5', '10.6', 
+                                  '99'],
+                                 ordered=True)
 
 def get_ruca_df():
     """Return `pandas.DataFrame` of Rural-Urban Commuting Area codes for all years."""
@@ -300,134 +271,90 @@ def get_ruca_df():
     if not path.exists():
         print(f'RUCA data not found at "{path}", attempting to download and construct...')
         download_and_combine_ruca()
-    df = pd.read_csv(path, dtype='str')
-    for c in ['YEAR', 'POPULATION', 'AREA']:
-        # ValueError: Unable to parse string "6 23.063" at position 269
-        # todo: input files probably had this error, add manual fix to `download_and_convert_ruca()`
-        df[c] = pd.to_numeric(df[c], 'coerce')
-    cats = ['1', '1.1', 
-            '2', '2.1', '2.2', 
-            '3', 
-            '4', '4.1', '4.2', 
-            '5', '5.1', '5.2', 
-            '6', '6.1', 
-            '7', '7.1', '7.2', '7.3', '7.4', 
-            '8', '8.1', '8.2', '8.3', '8.4', 
-            '9', '9.1', '9.2', 
-            '10', '10.1', '10.2', '10.3', '10.4', '10.5', '10.6', 
-            '99']
+    df = _read_combined_csv(path, _RUCA_COL_TYPES)
+    # ValueError: Unable to parse string "6 23.063" at position 269
+    # todo: input files probably had this error, add manual fix to `download_and_convert_ruca()`
+    num_cols = ['POPULATION', 'AREA']
+    df[num_cols] = df[num_cols].apply(pd.to_numeric, errors='coerce')
     df['RUCA_CODE'] = df['RUCA_CODE'].str.replace('.0', '', regex=False)
-    df['RUCA_CODE'] = pd.Categorical(df['RUCA_CODE'], cats, True)
+    df['RUCA_CODE'] = df['RUCA_CODE'].astype(_RUCA_CATS)
     return df
 
+# Year specifications, see `_load_year()`.
+_RUCA_DOC_SHEETS = [(None, {'sheet_name': 'RUCA code description'}),
+                    ('Data sources', {'sheet_name': 'Data sources'})]
+_RUCA_SPECS = [
+    {
+        'name': 'RUCA 1990',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53241/ruca1990.xls',
+        'read': {'sheet_name': 'Data'},
+        'cols_map': {'FIPS state-county-tract code': 'FIPS',
+                     'Rural-urban commuting area code': 'RUCA_CODE',
+                     'Census tract population, 1990': 'POPULATION',
+                     'Census tract land area, square miles, 1990': 'AREA',
+                     'County metropolitan status, 1993 (1=metro,0=nonmetro)': 'METRO'},
+        'static': {'YEAR': '1990'},
+        'doc': _RUCA_DOC_SHEETS
+    },
+    {
+        'name': 'RUCA 2000',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53241/ruca00.xls',
+        'read': {'sheet_name': 'Data'},
+        'cols_map': {
+            'Select State': 'STATE',
+            'Select County ': 'COUNTY',
+            'State County Tract Code': 'FIPS',
+            'RUCA Secondary Code 2000': 'RUCA_CODE',
+            'Tract Population 2000': 'POPULATION'
+        },
+        'static': {'YEAR': '2000'},
+        'doc': _RUCA_DOC_SHEETS
+    },
+    {
+        'name': 'RUCA 2010',
+        'url': 'https://www.ers.usda.gov/webdocs/DataFiles/53241/ruca2010revised.xlsx',
+        'read': {'sheet_name': 'Data', 'skiprows': 1},
+        'cols_map': {
+            'Select State': 'STATE',
+            'Select County': 'COUNTY',
+            'State-County-Tract FIPS Code (lookup by address at http://www.ffiec.gov/Geocode/)': 'FIPS',
+            'Secondary RUCA Code, 2010 (see errata)': 'RUCA_CODE',
+            'Tract Population, 2010': 'POPULATION',
+            'Land Area (square miles), 2010': 'AREA'
+        },
+        'static': {'YEAR': '2010'},
+        'doc': _RUCA_DOC_SHEETS
+    }
+]
+
 def download_and_combine_ruca():
     """Download Rural-Urban Commuting Area codes and documentation.
     Combine all years of data into single CSV file.
     Save all documentation into single TXT file."""
-    path = PATH['ruca']
-    path.parent.mkdir(parents=True, exist_ok=True)
-    ruca_src = PATH['source'] / 'ruca'
-    ruca_dfs = []
-    ruca_doc_dfs = []
-
-    # 1990
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53241/ruca1990.xls?v=9882.5'
-    fname = download_file(url, ruca_src)
-
-    df = pd.read_excel(fname, 'Data', dtype='str')
-    cols_map = {'FIPS state-county-tract code': 'FIPS',
-                'Rural-urban commuting area code': 'RUCA_CODE',
-                'Census tract population, 1990': 'POPULATION',
-                'Census tract land area, square miles, 1990': 'AREA',
-                'County metropolitan status, 1993 (1=metro,0=nonmetro)': 'METRO'}
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
+    df, doc = _combine_years(_RUCA_SPECS, PATH['source'] / 'ruca', list(_RUCA_COL_TYPES))
+    # 1990 tract codes are formatted with a dot
     df['FIPS'] = df['FIPS'].str.replace('.', '', regex=False)
-    df['YEAR'] = '1990'
-    ruca_dfs.append(df)
-
-    df = pd.concat([
-        pd.DataFrame(['RUCA 1990 documentation', '-' * 80, f'Data source: {url}']),
-        pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-        pd.DataFrame([[v, k] for k, v in cols_map.items()]),
-        pd.DataFrame(['']),
-        pd.read_excel(fname, 'RUCA code description', header=None, dtype='str'),
-        pd.DataFrame(['', 'Data sources']),
-        pd.read_excel(fname, 'Data sources', header=None, dtype='str')])
-    ruca_doc_dfs.append(df)
-
-
-    # 2000
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53241/ruca00.xls?v=9882.5'
-    fname = download_file(url, ruca_src)
-
-    df = pd.read_excel(fname, 'Data', dtype='str')
-
-    cols_map = {
-        'Select State': 'STATE',
-        'Select County ': 'COUNTY',
-        'State County Tract Code': 'FIPS',
-        'RUCA Secondary Code 2000': 'RUCA_CODE',
-        'Tract Population 2000': 'POPULATION'
-    }
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['YEAR'] = '2000'
-    ruca_dfs.append(df)
-
-    df = pd.concat([
-        pd.DataFrame(['RUCA 2000 documentation', '-' * 80, f'Data source: {url}']),
-        pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-        pd.DataFrame([[v, k] for k, v in cols_map.items()]),
-        pd.DataFrame(['']),
-        pd.read_excel(fname, 'RUCA code description', header=None, dtype='str'),
-        pd.DataFrame(['', 'Data sources']),
-        pd.read_excel(fname, 'Data sources', header=None, dtype='str')])
-    ruca_doc_dfs.extend([pd.DataFrame(['', '']), df])
-
-
-    # 2010
-    url = 'https://www.ers.usda.gov/webdocs/DataFiles/53241/ruca2010revised.xlsx?v=9882.5'
-    fname = download_file(url, ruca_src)
-
-    df = pd.read_excel(fname, 'Data', dtype='str', skiprows=1)
-    cols_map = {
-        'Select State': 'STATE',
-        'Select County': 'COUNTY',
-        'State-County-Tract FIPS Code (lookup by address at http://www.ffiec.gov/Geocode/)': 'FIPS',
-        'Secondary RUCA Code, 2010 (see errata)': 'RUCA_CODE',
-        'Tract Population, 2010': 'POPULATION',
-        'Land Area (square miles), 2010': 'AREA'
-    }
-    df = df.rename(columns=cols_map)
-    df = df[cols_map.values()]
-    df['YEAR'] = '2010'
-    ruca_dfs.append(df)
-
-    df = pd.concat([
-        pd.DataFrame(['RUCA 2010 documentation', '-' * 80, f'Data source: {url}']),
-        pd.DataFrame([[''], ['Column names'], ['Renamed', 'Original']]),
-        pd.DataFrame([[v, k] for k, v in cols_map.items()]),
-        pd.DataFrame(['']),
-        pd.read_excel(fname, 'RUCA code description', header=None, dtype='str'),
-        pd.DataFrame(['', 'Data sources']),
-        pd.read_excel(fname, 'Data sources', header=None, dtype='str')])
-    ruca_doc_dfs.extend([pd.DataFrame(['', '']), df])
-
-
-    # Combine and save to disk
-    df = pd.concat(ruca_dfs)
-    df = df[['FIPS', 'STATE', 'COUNTY', 'YEAR', 'RUCA_CODE', 'POPULATION', 'AREA', 'METRO']]
-    for col in df:
-        df[col] = df[col].str.strip()
-    df = df.sort_values(['FIPS', 'YEAR'])
-    df.to_csv(path, index=False)
-    print(f'Saved combined data to "{path}".')
-
-    df = pd.concat(ruca_doc_dfs)
-    for col in df:
-        df[col] = df[col].str.strip()
-    p = PATH['ruca_doc']
-    df.to_csv(p, '\t', header=False, index=False)
-    print(f'Saved documentation to "{p}".')
+    df.sort_values(['FIPS', 'YEAR'], inplace=True, kind='stable')
+    _save_combined(df, doc, PATH['ruca'], PATH['ruca_doc'])
+
+def _data_cleanup_ruca(which: typing.Literal['downloaded', 'processed', 'all']):
+    """Remove RUCA data files."""
+    if which in ['downloaded', 'all']:
+        print('Removing downloaded RUCA files.')
+        shutil.rmtree(PATH['source'] / 'ruca', ignore_errors=True)
+    if which in ['processed', 'all']:
+        print('Removing processed RUCA files.')
+        PATH['ruca'].unlink(missing_ok=True)
+        PATH['ruca_doc'].unlink(missing_ok=True)
+
+
+def build_all(rebuild=False):
+    """Construct all RUC, UI and RUCA data and documentation files.
+    Existing files are kept unless `rebuild` is True.
+    """
+    for key, build in [('ruc', download_and_combine_ruc),
+                       ('ui', download_and_combine_ui),
+                       ('ruca', download_and_combine_ruca)]:
+        if rebuild or not PATH[key].exists():
+            build()
 
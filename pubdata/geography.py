@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import os
 import functools
+import concurrent.futures
 import warnings
 import shutil
 import typing
@@ -12,8 +14,9 @@ import contextlib
 import numpy as np
 import pandas as pd
 import geopandas
+import shapely
 import pyarrow
-import pyarrow.dataset, pyarrow.parquet
+import pyarrow.compute, pyarrow.csv, pyarrow.dataset, pyarrow.parquet
 
 from .reseng.util import download_file
 from .reseng.nbd import Nbd
@@ -31,6 +34,24 @@ PATH = {
 PATH['source'].mkdir(parents=True, exist_ok=True)
 PATH['geo'].mkdir(parents=True, exist_ok=True)
 
+# data validation checks are skipped in trusted runs
+_VALIDATE = os.environ.get('PUBDATA_FAST') != '1'
+
+# options for writing shape parquet files, WKB geometries compress well with zstd
+_PARQUET_OPTS = dict(compression='zstd', compression_level=9, write_statistics=True)
+
+
+# pyogrio reads shapefiles in a single vectorized call, fiona (via geopandas) is used as fallback
+try:
+    import pyogrio
+except ImportError:
+    pyogrio = None
+
+def _read_shapefile(path):
+    """Read (zipped) shapefile into `geopandas.GeoDataFrame`."""
+    if pyogrio is None:
+        return geopandas.read_file(path)
+    return pyogrio.read_dataframe(path, use_arrow=True)
 
 # in geopandas 0.8, parquet support is still experimental
 # https://geopandas.org/docs/user_guide/io.html#apache-parquet-and-feather-file-formats
@@ -52,9 +73,38 @@ _REGION_STATE['BEA'] = {
     ('Far West', '98'): ['02', '06', '15', '32', '41', '53']
 }
 
+# state_code: region_name and state_code: region_code
+_BEA_NAME = {sc: rn for (rn, _), scs in _REGION_STATE['BEA'].items() for sc in scs}
+_BEA_CODE = {sc: rc for (_, rc), scs in _REGION_STATE['BEA'].items() for sc in scs}
+
 
 _STATE_REVISION_YEAR = 2021
 
+# small row groups of files sorted by code let filtered reads skip most of the file using min/max statistics
+_FILTER_ROW_GROUP_SIZE = 64
+
+def _validate_codes(df, cols, unique=True):
+    """Assert that columns `cols` of `df` have no missing values and, if `unique`, no duplicates.
+    Checks run on Arrow arrays: null count is stored with the array, and distinct count is a single hash pass."""
+    if not _VALIDATE:
+        return
+    for c in cols:
+        arr = pyarrow.array(df[c], from_pandas=True)
+        assert arr.null_count == 0, f'Missing values in column "{c}".'
+        if unique:
+            assert pyarrow.compute.count_distinct(arr).as_py() == len(arr), f'Duplicate values in column "{c}".'
+
+def _isin_filter(column, values):
+    """Return pyarrow dataset expression selecting rows with `column` in `values`, or None if `values` is None."""
+    if values is None:
+        return None
+    return pyarrow.dataset.field(column).isin(values)
+
+def _read_pq_columns(path, columns, filters=None):
+    """Read selected columns of parquet file into `pandas.DataFrame`, without touching other column chunks on disk.
+    Optional `filters` expression is used to skip row groups."""
+    return pyarrow.dataset.dataset(path, format='parquet').to_table(columns=columns, filter=filters).to_pandas()
+
 def get_state_src(scale: typing.Literal['20m', '5m', '500k', 'tiger'] = '5m'):
     """Download state boundary zipped shapefile and return path to it."""
     year = _STATE_REVISION_YEAR
@@ -71,45 +121,62 @@ def get_state_src(scale: typing.Literal['20m', '5m', '500k', 'tiger'] = '5m'):
         download_file(url, local_path.parent, local_path.name)
     return local_path    
 
+_STATE_COLUMNS = ['CODE', 'NAME', 'ABBR', 'CONTIGUOUS', 'TERRITORY', 'BEA_REGION_NAME', 'BEA_REGION_CODE', 'ALAND', 'AWATER']
+
+# full state frames by (scale, geometry), shared between calls, because state list is looked up often
+_STATE_DF_CACHE = {}
+
 def get_state_df(geometry: bool = True,
-                 scale: typing.Literal['20m', '5m', '500k', 'tiger'] = '5m'):
+                 scale: typing.Literal['20m', '5m', '500k', 'tiger'] = '5m',
+                 state_codes: list = None,
+                 readonly: bool = False):
     """Return geopandas.GeoDataFrame with state shapes.
     Set `geometry = False` to return pandas.DataFrame.
+    Optionally select subset of states with list of `state_codes`.
+    Full table is kept in memory after first read. Set `readonly = True` to get the cached object
+    itself instead of a copy, it must not be modified by the caller.
     """
-    columns = ['CODE', 'NAME', 'ABBR', 'CONTIGUOUS', 'TERRITORY', 'BEA_REGION_NAME', 'BEA_REGION_CODE', 'ALAND', 'AWATER']
+    columns = _STATE_COLUMNS
     pq_path = PATH['state'] / f'{scale}.pq'
-    if pq_path.exists():
-        if geometry:
-            return geopandas.read_parquet(pq_path)
-        else:
-            return pd.read_parquet(pq_path, 'pyarrow', columns)
+    key = (scale, geometry)
+    if key not in _STATE_DF_CACHE and pq_path.exists():
+        if geometry and state_codes is not None:
+            return geopandas.read_parquet(pq_path, filters=_isin_filter('CODE', state_codes))
+        _STATE_DF_CACHE[key] = geopandas.read_parquet(pq_path) if geometry else _read_pq_columns(pq_path, columns)
+    if key in _STATE_DF_CACHE:
+        df = _STATE_DF_CACHE[key]
+        if state_codes is not None:
+            return df[df['CODE'].isin(state_codes)].reset_index(drop=True)
+        return df if readonly else df.copy()
 
     src_path = get_state_src(scale)
-    df = geopandas.read_file(src_path)
+    df = _read_shapefile(src_path)
     df = df.rename(columns={'STATEFP': 'CODE', 'STUSPS': 'ABBR'})
     df['CONTIGUOUS'] = ~df['CODE'].isin(['02', '15', '60', '66', '69', '72', '78'])
     df['TERRITORY'] = df['CODE'].isin(['60', '66', '69', '72', '78'])
 
-    assert df.notna().all().all()
+    _validate_codes(df, ['CODE', 'NAME', 'ABBR'])
+    _validate_codes(df, ['ALAND', 'AWATER'], unique=False)
+    if _VALIDATE:
+        assert df.geometry.notna().all()
     
-    df[['BEA_REGION_NAME', 'BEA_REGION_CODE']] = None
-    for (region_name, region_code), state_codes in _REGION_STATE['BEA'].items():
-        df.loc[df['CODE'].isin(state_codes), 'BEA_REGION_NAME'] = region_name
-        df.loc[df['CODE'].isin(state_codes), 'BEA_REGION_CODE'] = region_code
+    df['BEA_REGION_NAME'] = pd.Categorical(df['CODE'].map(_BEA_NAME))
+    df['BEA_REGION_CODE'] = pd.Categorical(df['CODE'].map(_BEA_CODE))
     
+    df.sort_values('CODE', inplace=True, ignore_index=True)
     df = df[columns + ['geometry']]
-    df = df.sort_values('CODE').reset_index(drop=True)
     
-
-    for c in ['CODE', 'NAME', 'ABBR']:
-        assert not df.duplicated(c).any()
-    assert len(df) == (52 if scale == '20m' else 56)
+    if _VALIDATE:
+        assert len(df) == (52 if scale == '20m' else 56)
     
     pq_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(pq_path)
+    df.to_parquet(pq_path, row_group_size=_FILTER_ROW_GROUP_SIZE, **_PARQUET_OPTS)
     if not geometry:
-        df = pd.DataFrame(df).drop(columns='geometry')
-    return df
+        df = df.drop(columns='geometry')
+    _STATE_DF_CACHE[key] = df
+    if state_codes is not None:
+        return df[df['CODE'].isin(state_codes)].reset_index(drop=True)
+    return df if readonly else df.copy()
 
 def _data_cleanup_state(which: typing.Literal['downloaded', 'processed', 'all']):
     """Remove state data files."""
@@ -119,6 +186,7 @@ def _data_cleanup_state(which: typing.Literal['downloaded', 'processed', 'all'])
     if which in ['processed', 'all']:
         print('Removing processed state files.')
         shutil.rmtree(PATH['state'], ignore_errors=True)
+        _STATE_DF_CACHE.clear()
 
 
 def get_county_src(year=2020, scale='20m'):
@@ -149,17 +217,56 @@ def get_county_src(year=2020, scale='20m'):
     return local
 
 
-def get_county_df(year=2020, geometry=True, scale='20m'):
+# number of geometries united at once in `_cascaded_union()`
+_UNION_CHUNK = 100
+
+def _cascaded_union(geoms, chunk=_UNION_CHUNK):
+    """Union array of geometries in chunks and then union the partial results.
+    GEOS union scales poorly with the number of inputs, so this is faster for large arrays.
+    """
+    if len(geoms) <= chunk:
+        return shapely.union_all(geoms)
+    return shapely.union_all([shapely.union_all(geoms[i:i+chunk]) for i in range(0, len(geoms), chunk)])
+
+def _coverage_union(geoms):
+    """Union array of non-overlapping polygons, like parts of a single county or tract.
+    GEOS coverage union is much faster than general overlay, fall back to it if coverage union fails.
+    """
+    try:
+        return shapely.coverage_union_all(geoms)
+    except (shapely.errors.GEOSException, shapely.errors.UnsupportedGEOSVersionError):
+        return _cascaded_union(geoms)
+
+def _dissolve_code(df):
+    """Merge geometries of records that share the same CODE, keeping other columns from the first record.
+    Same result as `df.dissolve('CODE', as_index=False, sort=False)`, but only groups with multiple records
+    go through the union, which is done by vectorized shapely calls.
+    """
+    dup = df['CODE'].duplicated(keep=False)
+    if not dup.any():
+        return df
+    multi = df[dup]
+    geoms = multi.groupby('CODE', sort=False)['geometry'].agg(lambda s: _coverage_union(s.to_numpy()))
+    first = multi.drop_duplicates('CODE').copy()
+    first['geometry'] = geopandas.GeoSeries(geoms.loc[first['CODE']].to_numpy(), index=first.index, crs=df.crs)
+    df = pd.concat([df[~dup], first]).sort_index().reset_index(drop=True)
+    return df
 
+def get_county_df(year=2020, geometry=True, scale='20m', state_codes=None):
+    """Return geopandas.GeoDataFrame with county shapes.
+    Set `geometry = False` to return pandas.DataFrame.
+    Optionally select counties in list of `state_codes`.
+    """
     path = PATH['county']/f'{year}/{scale}.pq'
+    filters = _isin_filter('STATE_CODE', state_codes)
     if path.exists():
         if geometry:
-            return geopandas.read_parquet(path)
+            return geopandas.read_parquet(path, filters=filters)
         else:
-            return pd.read_parquet(path, 'pyarrow', ['CODE', 'NAME', 'STATE_CODE', 'COUNTY_CODE'])
+            return _read_pq_columns(path, ['CODE', 'NAME', 'STATE_CODE', 'COUNTY_CODE'], filters)
 
     p = get_county_src(year, scale)
-    df = geopandas.read_file(p)
+    df = _read_shapefile(p)
     if year == 1990:
         df = df.rename(columns={'ST': 'STATE_CODE', 'CO': 'COUNTY_CODE'})
     elif year in [2000, 2010]:
@@ -169,16 +276,21 @@ def get_county_df(year=2020, geometry=True, scale='20m'):
     df['CODE'] = df['STATE_CODE'] + df['COUNTY_CODE']
     df = df[['CODE', 'NAME', 'STATE_CODE', 'COUNTY_CODE', 'geometry']]
     
-    assert df['CODE'].notna().all()
+    _validate_codes(df, ['CODE'], unique=False)
 
     # 1990 and 2000 shapefiles have multiple polygon records per non-contiguous county
     if year in [1990, 2000]:
-        df = df.dissolve('CODE', as_index=False, sort=False)
+        df = _dissolve_code(df)
     
-    assert not df.duplicated('CODE').any()
+    _validate_codes(df, ['CODE'])
     
+    df = df.sort_values('CODE', ignore_index=True)
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(path)
+    # dictionary-encode only repetitive code columns, unique CODE and geometry do not benefit from it
+    df.to_parquet(path, row_group_size=_FILTER_ROW_GROUP_SIZE, use_dictionary=['STATE_CODE', 'COUNTY_CODE'],
+                  **_PARQUET_OPTS)
+    if state_codes is not None:
+        df = df[df['STATE_CODE'].isin(state_codes)].reset_index(drop=True)
     if not geometry:
         df = pd.DataFrame(df).drop(columns='geometry')
     return df
@@ -205,6 +317,25 @@ def _get_tract_gaz_src(year):
     return download_file(urls[year], local.parent, local.name)
 
 
+_GAZ_PA_TYPES = {'str': pyarrow.string(), 'int64': pyarrow.int64(), 'float64': pyarrow.float64()}
+
+def _read_gaz_tsv(src, cols):
+    """Read zipped tab-separated gazetteer file into `pandas.DataFrame` with multithreaded pyarrow parser.
+    `cols` maps column names to dtypes, header row is skipped.
+    """
+    names = list(cols)
+    types = {c: _GAZ_PA_TYPES[t] for c, t in cols.items()}
+    # last column may be padded with spaces, read it as string and trim before conversion
+    types[names[-1]] = pyarrow.string()
+    with zipfile.ZipFile(src) as zf, zf.open(zf.namelist()[0]) as f:
+        tbl = pyarrow.csv.read_csv(f,
+                                   read_options=pyarrow.csv.ReadOptions(skip_rows=1, column_names=names),
+                                   parse_options=pyarrow.csv.ParseOptions(delimiter='\t'),
+                                   convert_options=pyarrow.csv.ConvertOptions(column_types=types))
+    last = pyarrow.compute.utf8_trim_whitespace(tbl.column(names[-1])).cast(_GAZ_PA_TYPES[cols[names[-1]]])
+    tbl = tbl.set_column(len(names) - 1, names[-1], last)
+    return tbl.to_pandas()
+
 def get_tract_gaz_df(year):
     """Dataframe of national geographic gazeteer files for census tracts."""
     cache_path = PATH['geo'] / f'tract_gaz/{year}.pq'
@@ -244,7 +375,7 @@ def get_tract_gaz_df(year):
             'INTPTLAT': 'float64',
             'INTPTLONG': 'float64'
         }
-        df = pd.read_csv(src, sep='\t', skiprows=1, names=cols.keys(), dtype=cols)
+        df = _read_gaz_tsv(src, cols)
     else:
         cols = {
             'USPS': 'str',
@@ -256,7 +387,7 @@ def get_tract_gaz_df(year):
             'INTPTLAT': 'float64',
             'INTPTLONG': 'float64'
         }
-        df = pd.read_csv(src, sep='\t', skiprows=1, names=cols.keys(), dtype=cols)
+        df = _read_gaz_tsv(src, cols)
     
     cache_path.parent.mkdir(parents=True, exist_ok=True)
     df.to_parquet(cache_path, engine='pyarrow', index=False)
@@ -274,6 +405,9 @@ def _data_cleanup_tract_gaz(which: typing.Literal['downloaded', 'processed', 'al
         shutil.rmtree(PATH['geo'] / 'tract_gaz', ignore_errors=True)
 
 
+# number of concurrent source file downloads
+_DOWNLOAD_WORKERS = 16
+
 def get_tract_src(year, state_code):
     """Return path to zipped tract shapefile, downloading if missing."""
     url = 'https://www2.census.gov/geo/tiger/'
@@ -294,42 +428,109 @@ def get_tract_src(year, state_code):
         download_file(url, local.parent, local.name)
     return local
 
-def get_tract_df(years=None, state_codes=None, geometry=True):
+def get_tract_df(years=None, state_codes=None, geometry=True, bbox=None, max_workers=None):
+    """Return dataframe of census tracts, preparing missing (year, state) partitions first.
+    Optional `bbox = (minx, miny, maxx, maxy)` in longitude and latitude selects tracts with intersecting bounding boxes.
+    Missing partitions are prepared in parallel by a pool of `max_workers` processes
+    (defaults to number of CPUs).
+    """
     _years = years or [1990, 2000, 2010, 2020]
-    _state_codes = state_codes or get_state_df(geometry=False)['CODE'].tolist()
-    for y in _years:
-        for sc in _state_codes:
-            _prep_tract_df(y, sc)
+    _state_codes = state_codes or get_state_df(geometry=False, readonly=True)['CODE'].tolist()
+    if bbox is not None:
+        # partitions written before bbox column was added would have null bbox and never match the filter,
+        # they are removed here and rebuilt below
+        for y in _years:
+            for sc in _state_codes:
+                d = _tract_part_path(y, sc)
+                if d.exists() and any('bbox' not in pyarrow.parquet.read_schema(f).names for f in d.glob('*.pq')):
+                    print(f'Rebuilding tract partition {y}-{sc} without bbox column.')
+                    shutil.rmtree(d)
+    missing = [(y, sc) for y in _years for sc in _state_codes if not _tract_part_path(y, sc).exists()]
+    if missing:
+        # download sources concurrently, so that preparation in the process pool is purely local
+        with concurrent.futures.ThreadPoolExecutor(_DOWNLOAD_WORKERS) as executor:
+            list(executor.map(get_tract_src, *zip(*missing)))
+        # submit all partitions at once, so that the pool does not idle at the end of every year,
+        # and write all missing states of a year with a single dataset write as soon as they are ready
+        n_missing = {y: sum(yy == y for yy, _ in missing) for y in _years}
+        tables = {y: [] for y in _years}
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            futures = {executor.submit(_load_tract_table, y, sc): y for y, sc in missing}
+            for future in concurrent.futures.as_completed(futures):
+                y = futures[future]
+                tables[y].append(future.result())
+                if len(tables[y]) == n_missing[y]:
+                    _write_tract_tables(tables.pop(y))
     
-    p = pyarrow.dataset.partitioning(flavor='hive',
-        schema=pyarrow.schema([('YEAR', pyarrow.int16()), ('STATE_CODE', pyarrow.string())]))
-    f = [] if (years or state_codes) else None
+    p = _TRACT_PARTITIONING
+    # partition filter, applied during scan to skip unselected partitions
+    f = None
     if years:
-        f.append(('YEAR', 'in', years))
+        f = pyarrow.dataset.field('YEAR').isin(years)
     if state_codes:
-        f.append(('STATE_CODE', 'in', state_codes))
+        fs = pyarrow.dataset.field('STATE_CODE').isin(state_codes)
+        f = fs if f is None else (f & fs)
+    if bbox is not None:
+        # row groups are skipped by statistics of bbox fields
+        fld = lambda x: pyarrow.dataset.field('bbox', x)
+        fb = (fld('xmax') >= bbox[0]) & (fld('xmin') <= bbox[2]) & (fld('ymax') >= bbox[1]) & (fld('ymin') <= bbox[3])
+        f = fb if f is None else (f & fb)
+    c = ['YEAR', 'CODE', 'NAME', 'STATE_CODE', 'COUNTY_CODE', 'TRACT_CODE']
+    # explicit schema, so that partition column types and bbox struct do not depend on file discovery
+    ds = pyarrow.dataset.dataset(PATH['tract'], schema=_TRACT_SCHEMA.append(_TRACT_BBOX), format='parquet', partitioning=p)
     if geometry:
-        df = geopandas.read_parquet(PATH['tract'], partitioning=p, filters=f)
-        # todo: CRS information is not loaded from the dataset, 
-        # maybe because frames with missing CRS (1990) are in the mix.
-        df = df.set_crs('EPSG:4269')
-        return df
+        tbl = ds.to_table(columns=c + ['geometry'], filter=f)
+        df = tbl.drop(['geometry']).to_pandas()
+        # decode WKB in one vectorized call.
+        # CRS is set explicitly, because it is missing in 1990 partitions and is not loaded from the dataset.
+        geoms = shapely.from_wkb(tbl.column('geometry').to_numpy())
+        return geopandas.GeoDataFrame(df, geometry=geopandas.GeoSeries(geoms, index=df.index, crs='EPSG:4269'))
     else:
-        c = ['YEAR', 'CODE', 'NAME', 'STATE_CODE', 'COUNTY_CODE', 'TRACT_CODE']
-        return pyarrow.parquet.read_table(PATH['tract'], columns=c, partitioning=p, filters=f,
-                                          use_pandas_metadata=True).to_pandas()
-
-def _prep_tract_df(year, state_code):
-    """Download shapefiles for one year and one state, normalize column names and save as parquet partition."""
-    path = PATH['tract']/f'YEAR={year}/STATE_CODE={state_code}/part.pq'
-    if path.exists(): return
-
+        return ds.to_table(columns=c, filter=f).to_pandas()
+
+_TRACT_PARTITIONING = pyarrow.dataset.partitioning(flavor='hive',
+    schema=pyarrow.schema([('YEAR', pyarrow.int16()), ('STATE_CODE', pyarrow.string())]))
+
+# geometry is stored as WKB, CRS is assigned on read
+_TRACT_SCHEMA = pyarrow.schema([
+    ('YEAR', pyarrow.int16()),
+    ('STATE_CODE', pyarrow.string()),
+    ('CODE', pyarrow.string()),
+    ('NAME', pyarrow.string()),
+    ('COUNTY_CODE', pyarrow.string()),
+    ('TRACT_CODE', pyarrow.string()),
+    ('geometry', pyarrow.binary())
+])
+
+# bounding box of every tract, row group statistics of its fields allow to skip row groups by extent
+_TRACT_BBOX = pyarrow.field('bbox', pyarrow.struct([(c, pyarrow.float64()) for c in ['xmin', 'ymin', 'xmax', 'ymax']]))
+
+# small row groups, so that bbox statistics of Hilbert-sorted records describe compact areas
+_TRACT_ROW_GROUP_SIZE = 1024
+
+def _tract_part_path(year, state_code):
+    """Return path to directory of (year, state) tract partition."""
+    return PATH['tract']/f'YEAR={year}/STATE_CODE={state_code}'
+
+def _write_tract_tables(tables):
+    """Write list of tract tables into partitioned parquet dataset."""
+    # bbox coordinates of Hilbert-sorted tracts are similar in magnitude, byte stream split makes them compress better
+    bbox_cols = [f'bbox.{f.name}' for f in _TRACT_BBOX.type]
+    opts = pyarrow.dataset.ParquetFileFormat().make_write_options(use_dictionary=['COUNTY_CODE', 'TRACT_CODE', 'NAME'],
+                                                                  use_byte_stream_split=bbox_cols, **_PARQUET_OPTS)
+    pyarrow.dataset.write_dataset(tables, PATH['tract'], schema=_TRACT_SCHEMA.append(_TRACT_BBOX), format='parquet',
+                                  partitioning=_TRACT_PARTITIONING, basename_template='part{i}.pq',
+                                  existing_data_behavior='overwrite_or_ignore',
+                                  file_options=opts, max_rows_per_group=_TRACT_ROW_GROUP_SIZE)
+
+def _load_tract_table(year, state_code):
+    """Read shapefile for one year and one state, normalize column names and return as `pyarrow.Table`."""
     p = get_tract_src(year, state_code)
-    df = geopandas.read_file(p)
+    df = _read_shapefile(p)
     if year == 1990:
         if state_code == '34':
             # 2 records have NA tracts, don't know what it means
-            df = df[df['TRACTBASE'].notna()] 
+            df.dropna(subset=['TRACTBASE'], inplace=True)
         df = df.rename(columns={'ST': 'STATE_CODE', 'CO': 'COUNTY_CODE'})
         df['TRACT_CODE'] = df['TRACTBASE'] + df['TRACTSUF'].fillna('00')
     elif year == 2000:
@@ -340,20 +541,41 @@ def _prep_tract_df(year, state_code):
     elif year == 2020:
         df = df.rename(columns={'STATEFP': 'STATE_CODE', 'COUNTYFP': 'COUNTY_CODE', 'TRACTCE': 'TRACT_CODE'})
     df['CODE'] = df['STATE_CODE'] + df['COUNTY_CODE'] + df['TRACT_CODE']
-    assert (df['CODE'].str.len() == 11).all(), f'Tract {year} {state_code}: wrong code length.'
-    df['NAME'] = df['TRACT_CODE'].astype('int64').astype('str')
-    df['NAME'] = df['NAME'].str[:-2] + '.' + df['NAME'].str[-2:]
+    if _VALIDATE:
+        assert (df['CODE'].str.len() == 11).all(), f'Tract {year} {state_code}: wrong code length.'
+    # tract name is code with last two digits after the decimal point: '012345' -> '123.45'.
+    # codes below 100 keep their historical names without leading zeros: '000005' -> '.5'
+    codes = df['TRACT_CODE'].astype('int64').to_numpy()
+    big = codes >= 100
+    base = np.where(big, (codes // 100).astype('U'), '')
+    suffix = np.where(big, np.char.zfill((codes % 100).astype('U'), 2), codes.astype('U'))
+    df['NAME'] = np.char.add(np.char.add(base, '.'), suffix)
     df = df[['CODE', 'NAME', 'geometry', 'COUNTY_CODE', 'TRACT_CODE']]
     
-    assert df['CODE'].notna().all()
+    _validate_codes(df, ['CODE'], unique=False)
     # 1990 and 2000 shapefiles have multiple polygon records per non-contiguous tract
     if year in [1990, 2000]:
-        df = df.dissolve('CODE', as_index=False, sort=False)
+        df = _dissolve_code(df)
 
-    assert not df.duplicated('CODE').any()
+    _validate_codes(df, ['CODE'])
+
+    # order records along Hilbert curve, so that neighboring tracts end up in the same row group
+    df = df.iloc[df.geometry.hilbert_distance().to_numpy().argsort()]
+    b = df.geometry.bounds
+    bbox = pyarrow.StructArray.from_arrays([pyarrow.array(b[c]) for c in ['minx', 'miny', 'maxx', 'maxy']],
+                                           fields=list(_TRACT_BBOX.type))
         
-    path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(path)
+    df = pd.DataFrame({
+        'YEAR': year,
+        'STATE_CODE': state_code,
+        'CODE': df['CODE'],
+        'NAME': df['NAME'],
+        'COUNTY_CODE': df['COUNTY_CODE'],
+        'TRACT_CODE': df['TRACT_CODE'],
+        'geometry': df.geometry.to_wkb()
+    })
+    tbl = pyarrow.Table.from_pandas(df, schema=_TRACT_SCHEMA, preserve_index=False)
+    return tbl.append_column(_TRACT_BBOX, bbox)
 
 
 def _get_tract_xwalk_time_src(y1: typing.Literal[2000, 2010]):
@@ -370,15 +592,42 @@ def _get_tract_xwalk_time_src(y1: typing.Literal[2000, 2010]):
     return local
 
 def _get_tract_xwalk_time_meta(y1: typing.Literal[2000, 2010]):
-    """Metadata for national relationship file for tract change between `y1` and `y1`-10."""
+    """Metadata for national relationship file for tract change between `y1` and `y1`-10.
+    Record layout is parsed from Census web page once and saved next to the source file.
+    """
+    local = PATH['source'] / f'tract_xwalk_time/{y1}_meta.csv'
+    if local.exists():
+        return pd.read_csv(local)
+
     base = 'https://www.census.gov/programs-surveys/geography/technical-documentation/records-layout/'
     urls = {
         2000: f'{base}2000-tract-relationship-record-layout.html',
         2010: f'{base}2010-census-tract-record-layout.html'
     }
+    print(f'File "{local}" not found, attempting download.')
     meta = pd.read_html(urls[y1])[0]
+    local.parent.mkdir(parents=True, exist_ok=True)
+    meta.to_csv(local, index=False)
     return meta
 
+def _read_fixed_width(path, widths, names, encoding):
+    """Read fixed-width text file into `pandas.DataFrame` of whitespace-stripped strings.
+    Records are loaded into a 2D byte array, and every field is sliced out as a block of columns.
+    Like `pd.read_fwf()`, blank lines are skipped and empty fields are NaN.
+    """
+    lines = [l for l in path.read_bytes().splitlines() if l.strip()]
+    rec_len = sum(widths)
+    # shorter records are padded with null bytes, longer are truncated
+    arr = np.array(lines, dtype=f'S{rec_len}').view('S1').reshape(len(lines), rec_len)
+    cols = {}
+    start = 0
+    for name, w in zip(names, widths):
+        field = arr[:, start:start + w].copy().view(f'S{w}').ravel()
+        cols[name] = np.char.strip(np.char.decode(field, encoding))
+        start += w
+    df = pd.DataFrame(cols)
+    return df.mask(df == '')
+
 def get_tract_xwalk_time_df(y1: typing.Literal[2000, 2010]):
     """Dataframe of national relationship table for tract change between `y1` and `y1`-10."""
     cache_path = PATH['geo'] / f'tract_xwalk_time/{y1}.pq'
@@ -390,9 +639,7 @@ def get_tract_xwalk_time_df(y1: typing.Literal[2000, 2010]):
     col_desc = {}
     y0 = y1 - 10
     if y1 == 2000:
-        df = pd.read_fwf(src, encoding='ISO-8859-1', dtype='str', header=None,
-                         widths=meta['Field Length'].tolist())
-        df.columns = meta['Field Description']
+        df = _read_fixed_width(src, meta['Field Length'].tolist(), meta['Field Description'].tolist(), 'ISO-8859-1')
 
         c = col_desc['ALAND'] = 'Land area of the record (1000 sq.meters)'
         df['ALAND'] = df[c].astype(int)
@@ -460,21 +707,25 @@ def get_zcta_src(year: int):
     return local
 
 
-def get_zcta_df(year=2020, geometry=True):
-
+def get_zcta_df(year=2020, geometry=True, zctas=None):
+    """Return geopandas.GeoDataFrame with ZCTA shapes.
+    Set `geometry = False` to return pandas.DataFrame.
+    Optionally select subset of ZCTAs with list of `zctas`.
+    """
     path = PATH['zcta'] / f'{year}.pq'
+    filters = _isin_filter('ZCTA', zctas)
     if path.exists():
         if geometry:
-            return geopandas.read_parquet(path)
+            return geopandas.read_parquet(path, filters=filters)
         else:
-            return pd.read_parquet(path, 'pyarrow').drop(columns=['geometry'])
+            return _read_pq_columns(path, ['ZCTA', 'ALAND', 'AWATER'], filters)
     
     # add other years later as needed
     if not (2013 <= year <= 2020):
         raise NotImplementedError(f'Year {year}.')
         
     f = get_zcta_src(year)
-    df = geopandas.read_file(f)
+    df = _read_shapefile(f)
     if 2013 <= year <= 2019:
         df = df.rename(columns={'ZCTA5CE10': 'ZCTA', 'ALAND10': 'ALAND', 'AWATER10': 'AWATER'})
     elif year == 2020:
@@ -482,11 +733,13 @@ def get_zcta_df(year=2020, geometry=True):
         
     df = df[['ZCTA', 'ALAND', 'AWATER', 'geometry']]
     
-    assert df['ZCTA'].notna().all()
-    assert not df.duplicated('ZCTA').any()
+    _validate_codes(df, ['ZCTA'])
     
+    df = df.sort_values('ZCTA', ignore_index=True)
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(path)
+    df.to_parquet(path, row_group_size=_FILTER_ROW_GROUP_SIZE, **_PARQUET_OPTS)
+    if zctas is not None:
+        df = df[df['ZCTA'].isin(zctas)].reset_index(drop=True)
     if not geometry:
         df = pd.DataFrame(df).drop(columns='geometry')
     return df
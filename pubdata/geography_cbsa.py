@@ -9,8 +9,10 @@ from contextlib import redirect_stdout
 
 import pandas as pd
 import geopandas
+import pyarrow.dataset
 
 from .reseng import util
+from . import geography
 from .reseng.caching import simplecache
 from .reseng.monitor import log_start_finish
 from .reseng.nbd import Nbd
@@ -21,13 +23,22 @@ nbd = Nbd('pubdata')
 PATH = {
     'data': nbd.root / 'data/',
     'source_delin': nbd.root / 'data/source/geography_cbsa/delin/',
+    'delin': nbd.root / 'data/geography_cbsa/delin/',
     'source_shape': nbd.root / 'data/source/geography_cbsa/shape/',
+    'shape': nbd.root / 'data/geography_cbsa/shape/',
 }
 
+# set once directories are created, reset by cleanup functions that remove them
+_DIRS_READY = False
+
 def init_dirs():
     """Create necessary directories."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
     for p in PATH.values():
         p.mkdir(parents=True, exist_ok=True)
+    _DIRS_READY = True
     
 def cleanup_all(remove_downloaded=False):
     cleanup_delin(remove_downloaded)
@@ -74,11 +85,27 @@ def get_cbsa_delin_src(year: int):
     return local
 
 def get_cbsa_delin_df(year: int):
+    """Return CBSA delineation dataframe, prepared from source file on first call and cached in parquet."""
+    cache_path = PATH['delin'] / f'{year}.pq'
+    if cache_path.exists():
+        return pd.read_parquet(cache_path)
+
     f = get_cbsa_delin_src(year)
-    
     if year == 1993:
-        return _prep_cbsa_delin_df_1993(f)
-    
+        df = _prep_cbsa_delin_df_1993(f)
+    else:
+        df = _prep_cbsa_delin_df(year, f)
+
+    # repetitive columns are dictionary-encoded in parquet
+    for c in ['METRO_MICRO', 'CENTRAL_OUTLYING', 'STATE', 'STATE_CODE']:
+        if c in df:
+            df[c] = df[c].astype('category')
+    df.to_parquet(cache_path, engine='pyarrow', index=False)
+    return df
+
+
+def _prep_cbsa_delin_df(year, src_file):
+
     # number of rows to skip at top and bottom varies by year
     if year in [2003, 2013, 2015, 2017, 2018, 2020, 2023]:
         skip_head = 2
@@ -96,7 +123,7 @@ def get_cbsa_delin_df(year: int):
     elif year in [2013, 2023]:
         skip_foot = 3
 
-    df = pd.read_excel(f, dtype=str, skiprows=skip_head, skipfooter=skip_foot)
+    df = pd.read_excel(src_file, dtype=str, skiprows=skip_head, skipfooter=skip_foot)
 
     # standardize column names
     if 2003 <= year <= 2009:
@@ -175,6 +202,10 @@ def _prep_cbsa_delin_df_1993(src_file):
 
 
 def cleanup_delin(remove_downloaded=False):
+    global _DIRS_READY
+    _DIRS_READY = False
+    print('Removing processed files...')
+    shutil.rmtree(PATH['delin'], ignore_errors=True)
     if remove_downloaded:
         print('Removing downloaded files...')
         shutil.rmtree(PATH['source_delin'], ignore_errors=True)
@@ -220,9 +251,18 @@ def get_cbsa_shape_src(year=2021, scale='20m'):
 def get_cbsa_shape_df(year=2021, 
                     scale: typing.Literal['20m', '5m', '500k'] = '20m',
                     geometry=True):
-    """Load CBSA shapefile as geodataframe."""
+    """Load CBSA shapefile as geodataframe.
+    Processed shapes are cached in parquet, `geometry = False` does not read geometry column from the cache.
+    """
+    path = PATH['shape'] / f'{year}_{scale}.pq'
+    if path.exists():
+        if geometry:
+            return geopandas.read_parquet(path)
+        ds = pyarrow.dataset.dataset(path, format='parquet')
+        return ds.to_table(columns=[c for c in ds.schema.names if c != 'geometry']).to_pandas()
+
     f = get_cbsa_shape_src(year, scale)
-    df = geopandas.read_file(f)
+    df = geography._read_shapefile(f)
 
     if year == 2010:
         df = df.rename(columns={
@@ -230,7 +270,7 @@ def get_cbsa_shape_df(year=2021,
             'NAME': 'CBSA_TITLE',
             'LSAD': 'METRO_MICRO',
         })
-        df['METRO_MICRO'] = df['METRO_MICRO'].str.lower()
+        df['METRO_MICRO'] = df['METRO_MICRO'].str.lower().astype('category')
         df = df[['CBSA_CODE', 'CBSA_TITLE', 'METRO_MICRO', 'CENSUSAREA', 'geometry']]
     elif 2013 <= year <= 2021:
         df = df.rename(columns={
@@ -238,7 +278,7 @@ def get_cbsa_shape_df(year=2021,
             'NAME': 'CBSA_TITLE',
             'LSAD': 'METRO_MICRO',
         })
-        df['METRO_MICRO'] = df['METRO_MICRO'].map({'M1': 'metro', 'M2': 'micro'})
+        df['METRO_MICRO'] = df['METRO_MICRO'].map({'M1': 'metro', 'M2': 'micro'}).astype('category')
         df = df[['CBSA_CODE', 'CBSA_TITLE', 'METRO_MICRO', 'ALAND', 'AWATER', 'geometry']]
     else:
         raise NotImplementedError(f'Year {year}.')
@@ -246,12 +286,17 @@ def get_cbsa_shape_df(year=2021,
     assert df['CBSA_CODE'].notna().all()
     assert not df['CBSA_CODE'].duplicated().any()
 
+    df.to_parquet(path)
     if not geometry:
         df = pd.DataFrame(df).drop(columns='geometry')
     return df
 
 
 def cleanup_shape(remove_downloaded=False):
+    global _DIRS_READY
+    _DIRS_READY = False
+    print('Removing processed files...')
+    shutil.rmtree(PATH['shape'], ignore_errors=True)
     if remove_downloaded:
         print('Removing downloaded files...')
         shutil.rmtree(PATH['source_shape'], ignore_errors=True)
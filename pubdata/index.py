@@ -32,15 +32,17 @@ def _this_proj_root():
     return caller_dir.parent
 
 def _recreate_dir_symlink(link, targ, root):
-    """Remove and create new symlink from `link` to `targ`.
+    """Remove and create new symlink from `link` to `targ`, unless it already exists.
     `link` must be relative to `root`.
     `targ` must be relative to directory containing `link`.
     Example: _recreate_dir_symlink('nbs/reseng', '../reseng', Path('/path/to/proj/root'))
     """
     link = (root / link).absolute()
     assert (link.parent / targ).is_dir()
-    link.unlink(missing_ok=True)
-    link.symlink_to(Path(targ), target_is_directory=True)
+    # keep existing link if it already points to `targ`
+    if not (link.is_symlink() and Path(os.readlink(link)) == Path(targ)):
+        link.unlink(missing_ok=True)
+        link.symlink_to(Path(targ), target_is_directory=True)
     link_res = link.resolve()
     assert link_res.is_dir()
     print(f'  symlink: "{link.relative_to(root)}" -> "{link_res.relative_to(root)}"')
@@ -4,6 +4,7 @@
 import typing
 import pathlib
 import urllib
+import concurrent.futures
 
 import pandas as pd
 
@@ -13,8 +14,16 @@ from .reseng.nbd import Nbd
 nbd = Nbd('pubdata')
 PATH = {
     'source': nbd.root/'data/source/naics',
+    'proc': nbd.root/'data/naics',
 }
 
+# calamine (Rust) reads Excel files much faster than xlrd and openpyxl, requires pandas>=2.2
+try:
+    import python_calamine
+    _EXCEL_ENGINE = 'calamine' if tuple(map(int, pd.__version__.split('.')[:2])) >= (2, 2) else None
+except ImportError:
+    _EXCEL_ENGINE = None
+
 
 _src_url_base = 'https://www.census.gov/naics/'
 _src_urls = {
@@ -50,9 +59,30 @@ def get_src(year: typing.Literal[1997, 2002, 2007, 2012, 2017, 2022],
     return path
 
 
+# frames by function arguments, shared between calls within process, callers receive copies
+_DF_CACHE = {}
+
+# version of cached code tables, bump to rebuild them after changes in layout or dtypes
+_CODE_CACHE_VERSION = 3
+# string columns of code tables, arrow-backed while table is built, returned as object as callers expect
+_CODE_STR_COLS = ['CODE', 'TITLE', 'CODE_2', 'CODE_3', 'CODE_4', 'CODE_5', 'CODE_6']
+
 def get_df(year: typing.Literal[1997, 2002, 2007, 2012, 2017, 2022],
            kind: typing.Literal['code', 'index', 'descriptions', 'summary']):
-    """Return tidy dataframe built from source file."""
+    """Return tidy dataframe built from source file.
+    Result is cached in parquet, except for "summary" with two-level column header.
+    """
+    key = ('df', year, kind)
+    if key in _DF_CACHE:
+        return _DF_CACHE[key].copy()
+    if kind == 'code':
+        cache_path = PATH['proc']/f'{year}/{kind}_v{_CODE_CACHE_VERSION}.pq'
+    else:
+        cache_path = PATH['proc']/f'{year}/{kind}.pq'
+    if cache_path.exists():
+        df = pd.read_parquet(cache_path)
+        _DF_CACHE[key] = df
+        return df.copy()
     
     src_file = get_src(year, kind)
     
@@ -70,46 +100,52 @@ def get_df(year: typing.Literal[1997, 2002, 2007, 2012, 2017, 2022],
                              names=['SEQ_NO', 'CODE', 'TITLE'], usecols=['CODE', 'TITLE'])
             df['TITLE'] = df['TITLE'].str.strip('"')
         elif year in [2012, 2017, 2022]:
-            df = pd.read_excel(src_file, dtype=str, skiprows=2, header=None)
+            df = pd.read_excel(src_file, engine=_EXCEL_ENGINE, dtype=str, skiprows=2, header=None)
             df = df.iloc[:, [1,2]] 
             df.columns = ['CODE', 'TITLE']
         
+        # arrow-backed strings, so that string methods below run as vectorized pyarrow kernels
+        df = df.astype({'CODE': 'string[pyarrow]', 'TITLE': 'string[pyarrow]'})
         assert (df['CODE'].isin(['31-33', '44-45', '48-49']) | df['CODE'].str.isdigit()).all()
         
-        df['DIGITS'] = df['CODE'].str.len()
+        df['DIGITS'] = df['CODE'].str.len().astype('int8')
         df.loc[df['CODE'] == '31-33', 'DIGITS'] = 2
         df.loc[df['CODE'] == '44-45', 'DIGITS'] = 2
         df.loc[df['CODE'] == '48-49', 'DIGITS'] = 2
         assert df['DIGITS'].isin([2, 3, 4, 5, 6]).all()
 
-        df.loc[df['DIGITS'] == 2, 'CODE_2'] = df['CODE']
-        df['CODE_2'] = df['CODE_2'].fillna(method='ffill')
-        df.loc[df['DIGITS'] == 3, 'CODE_3'] = df['CODE']
-        df['CODE_3'] = df.groupby('CODE_2')['CODE_3'].fillna(method='ffill')
-        df.loc[df['DIGITS'] == 4, 'CODE_4'] = df['CODE']
-        df['CODE_4'] = df.groupby('CODE_3')['CODE_4'].fillna(method='ffill')
-        df.loc[df['DIGITS'] == 5, 'CODE_5'] = df['CODE']
-        df['CODE_5'] = df.groupby('CODE_4')['CODE_5'].fillna(method='ffill')
-        df.loc[df['DIGITS'] == 6, 'CODE_6'] = df['CODE']
+        # codes are listed in hierarchical order, so ancestor at level k is the last preceding k-digit code,
+        # valid if row is at level k or below and its code starts with that ancestor
+        df['CODE_2'] = df['CODE'].where(df['DIGITS'] == 2).ffill()
+        for k in [3, 4, 5]:
+            ck = df['CODE'].where(df['DIGITS'] == k).ffill()
+            df[f'CODE_{k}'] = ck.where((df['DIGITS'] >= k) & (df['CODE'].str[:k] == ck))
+        df['CODE_6'] = df['CODE'].where(df['DIGITS'] == 6)
+        for c in _CODE_STR_COLS:
+            df[c] = df[c].to_numpy(dtype=object, na_value=None)
         
     elif kind == 'index':
-        df = pd.read_excel(src_file, names=['CODE', 'INDEX_ITEM'], dtype=str)
+        df = pd.read_excel(src_file, engine=_EXCEL_ENGINE, names=['CODE', 'INDEX_ITEM'], dtype=str)
         # at the bottom of the table are ****** codes with comments for a few industries.
         df = df[df['CODE'] != '******']
         assert df['CODE'].str.isdigit().all()
         assert (df['CODE'].str.len() == 6).all()
     elif kind == 'descriptions':
-        df = pd.read_excel(src_file, names=['CODE', 'TITLE', 'DESCRIPTION'], dtype=str)
+        df = pd.read_excel(src_file, engine=_EXCEL_ENGINE, names=['CODE', 'TITLE', 'DESCRIPTION'], dtype=str)
         assert (df['CODE'].isin(['31-33', '44-45', '48-49']) | df['CODE'].str.isdigit()).all()
     elif kind == 'summary':
-        df = pd.read_excel(src_file, header=None).fillna('')
+        df = pd.read_excel(src_file, engine=_EXCEL_ENGINE, header=None).fillna('')
         df.columns = pd.MultiIndex.from_frame(df.head(2).T, names=['', ''])
         df = df.drop(index=[0,1]).reset_index(drop=True)
         df.iloc[:, 2:] = df.iloc[:, 2:].astype(int)
         df['Sector'] = df['Sector'].astype(str)
     
     df = df.reset_index(drop=True)
-    return df
+    if kind != 'summary':
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_path, engine='pyarrow', index=False)
+    _DF_CACHE[key] = df
+    return df.copy()
 
 
 def compute_structure_summary(year):
@@ -121,7 +157,7 @@ def compute_structure_summary(year):
     t['Subsectors (3-digit)'] = df.groupby('CODE_2')['CODE_3'].nunique()
     t['Industry Groups (4-digit)'] = df.groupby('CODE_2')['CODE_4'].nunique()
     t['NAICS Industries (5-digit)'] = df.groupby('CODE_2')['CODE_5'].nunique()
-    same_as_5d = df['CODE_6'].str[-1] == '0'
+    same_as_5d = df['CODE_6'].str.endswith('0', na=False)
     t['6-digit Industries (U.S. Detail)'] = df[~same_as_5d].groupby('CODE_2')['CODE_6'].nunique()
     t['6-digit Industries (Same as 5-digit)'] = df[same_as_5d].groupby('CODE_2')['CODE_6'].nunique()
     t['6-digit Industries (Total)'] = df.groupby('CODE_2')['CODE_6'].nunique()
@@ -166,11 +202,22 @@ def get_concordance_src(fro: str, fro_year: int, to: str, to_year: int):
     return path
 
 
+def _concordance_path(fro, fro_year, to, to_year):
+    return PATH['proc']/f'concordance/{fro}_{fro_year}_to_{to}_{to_year}.pq'
+
 def get_concordance_df(fro: str, fro_year: int, to: str, to_year: int):
     """Return concordance dataframe built from source file.
     Concordance table from (`fro`, `fro_year`) to (`to`, `to_year`),
     e.g. from ("naics", 2017) to ("naics", 2022).
+    Result is cached in parquet.
     """
+    key = ('concordance', fro, fro_year, to, to_year)
+    if key in _DF_CACHE:
+        return _DF_CACHE[key].copy()
+    cache_path = _concordance_path(fro, fro_year, to, to_year)
+    if cache_path.exists():
+        _DF_CACHE[key] = pd.read_parquet(cache_path)
+        return _DF_CACHE[key].copy()
     
     src_file = get_concordance_src(fro, fro_year, to, to_year)
 
@@ -180,14 +227,14 @@ def get_concordance_df(fro: str, fro_year: int, to: str, to_year: int):
     t_to = f'TITLE_{to_year}'.upper()
 
     if (fro == to == 'naics') and ((fro_year == 1997) or (to_year == 1997)):
-        df = pd.read_excel(src_file, sheet_name=1, dtype=str, skipfooter=1)
+        df = pd.read_excel(src_file, engine=_EXCEL_ENGINE, sheet_name=1, dtype=str, skipfooter=1)
         df.columns = [c_fro, t_fro, c_to, t_to, 'EXPLANATION']
         
     if (fro == to == 'naics') and (fro_year > 1997) and (to_year > 1997):
-        df = pd.read_excel(src_file, dtype=str, skiprows=3, header=None)
-        # columns beyond first four have no data
-        for c in df.iloc[:, 4:]:
-            assert (df[c].isna() | df[c].str.isspace()).all()
+        df = pd.read_excel(src_file, engine=_EXCEL_ENGINE, dtype=str, skiprows=3, header=None)
+        # columns beyond first four have no data, checked on all their cells at once
+        tail = pd.Series(df.iloc[:, 4:].to_numpy().ravel(), dtype='string[pyarrow]').dropna()
+        assert tail.str.isspace().all()
         df = df.iloc[:, :4]
         df.columns = [c_fro, t_fro, c_to, t_to]
         
@@ -210,7 +257,23 @@ def get_concordance_df(fro: str, fro_year: int, to: str, to_year: int):
 
     df = df.sort_values([c_fro, c_to], ignore_index=True)
     
-    return df
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(cache_path, engine='pyarrow', index=False)
+    _DF_CACHE[key] = df
+    return df.copy()
+
+def _build_concordance(pair):
+    get_concordance_df(*pair)
+
+def get_concordance_dfs(pairs: list, max_workers=None):
+    """Return list of concordance dataframes, one for every (`fro`, `fro_year`, `to`, `to_year`) tuple in `pairs`.
+    Tables not yet cached in parquet are built in parallel by a pool of `max_workers` processes.
+    """
+    missing = [p for p in set(pairs) if not _concordance_path(*p).exists()]
+    if len(missing) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            list(executor.map(_build_concordance, missing))
+    return [get_concordance_df(*p) for p in pairs]
 
 
 def find_concordance_group(df, fro, to, fro_values):
@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import os
 import shutil
+import zipfile
+import concurrent.futures
 
 import pandas as pd
-import pyarrow, pyarrow.parquet, pyarrow.dataset
+import pyarrow, pyarrow.compute, pyarrow.csv, pyarrow.parquet, pyarrow.dataset
 
 from .reseng.monitor import log_start_finish
 from .reseng.util import download_file
@@ -30,6 +33,9 @@ def cleanup(remove_downloaded=False):
     shutil.rmtree(PATH['proc'], ignore_errors=True)
 
 
+# number of concurrent yearly file downloads, kept moderate to avoid BLS rate limiting
+_DOWNLOAD_WORKERS = 8
+
 @log_start_finish
 def _get_src(year):
     _init_dirs()
@@ -39,11 +45,12 @@ def _get_src(year):
 
 def _test_get_src(redownload=False):
     cleanup(redownload)
-    for y in range(1990, 2022):
-        print(y, end=' ')
-        _get_src(y)
+    _init_dirs()
+    with concurrent.futures.ThreadPoolExecutor(_DOWNLOAD_WORKERS) as executor:
+        list(executor.map(_get_src, range(1990, 2022)))
 
 
+# counts, weekly wages and annual pay fit in int32, wage and contribution totals exceed 2^31 and stay int64
 _schema_pandas = {
     'area_fips': 'str',
     'own_code': 'str',
@@ -53,13 +60,13 @@ _schema_pandas = {
     'year': 'int16',
     'qtr': 'str',
     'disclosure_code': 'str',
-    'annual_avg_estabs': 'int64',
-    'annual_avg_emplvl': 'int64',
+    'annual_avg_estabs': 'int32',
+    'annual_avg_emplvl': 'int32',
     'total_annual_wages': 'int64',
     'taxable_annual_wages': 'int64',
     'annual_contributions': 'int64',
-    'annual_avg_wkly_wage': 'int64',
-    'avg_annual_pay': 'int64',
+    'annual_avg_wkly_wage': 'int32',
+    'avg_annual_pay': 'int32',
     'lq_disclosure_code': 'str',
     'lq_annual_avg_estabs': 'float64',
     'lq_annual_avg_emplvl': 'float64',
@@ -69,9 +76,9 @@ _schema_pandas = {
     'lq_annual_avg_wkly_wage': 'float64',
     'lq_avg_annual_pay': 'float64',
     'oty_disclosure_code': 'str',
-    'oty_annual_avg_estabs_chg': 'int64',
+    'oty_annual_avg_estabs_chg': 'int32',
     'oty_annual_avg_estabs_pct_chg': 'float64',
-    'oty_annual_avg_emplvl_chg': 'int64',
+    'oty_annual_avg_emplvl_chg': 'int32',
     'oty_annual_avg_emplvl_pct_chg': 'float64',
     'oty_total_annual_wages_chg': 'int64',
     'oty_total_annual_wages_pct_chg': 'float64',
@@ -79,40 +86,73 @@ _schema_pandas = {
     'oty_taxable_annual_wages_pct_chg': 'float64',
     'oty_annual_contributions_chg': 'int64',
     'oty_annual_contributions_pct_chg': 'float64',
-    'oty_annual_avg_wkly_wage_chg': 'int64',
+    'oty_annual_avg_wkly_wage_chg': 'int32',
     'oty_annual_avg_wkly_wage_pct_chg': 'float64',
-    'oty_avg_annual_pay_chg': 'int64',
+    'oty_avg_annual_pay_chg': 'int32',
     'oty_avg_annual_pay_pct_chg': 'float64',   
 }
 
-@log_start_finish
-def _build_pq(year):
-    path = PATH['proc'] / f'{year}/part.pq'
-    if path.exists(): return
-
-    src = _get_src(year)
-    df = pd.read_csv(src, dtype=_schema_pandas)
-    assert (df['year'] == year).all()
-    del df['year']
-    
-    path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(path, engine='pyarrow', index=False)
-
-
 _dt_pd2pq = {
     'str': pyarrow.string(),
     'int16': pyarrow.int16(),
+    'int32': pyarrow.int32(),
     'int64': pyarrow.int64(),
     'float64': pyarrow.float64()
 }
 
 _schema_parquet = pyarrow.schema([pyarrow.field(n, _dt_pd2pq[t]) for n, t in _schema_pandas.items()])
 
-def get_df(years, cols=None, filters=None):
-    for year in years:
-        part_path = PATH['proc'] / f'{year}/part.pq'
-        if not part_path.exists():
-            _build_pq(year)
+# low-cardinality code columns, dictionary-encoded in parquet
+_dict_cols = ['area_fips', 'own_code', 'industry_code', 'size_code', 'qtr',
+              'disclosure_code', 'lq_disclosure_code', 'oty_disclosure_code']
+
+# dataset is stored in directories "{year}/{agglvl_code}/", partition values are not stored in files
+_partitioning = pyarrow.dataset.partitioning(pyarrow.schema([('year', pyarrow.int16()), ('agglvl_code', pyarrow.string())]))
+
+def _batches_without_year(reader, year):
+    """Yield record batches from CSV `reader` with "year" column removed, checking that it equals `year`."""
+    i = reader.schema.get_field_index('year')
+    schema = reader.schema.remove(i)
+    for batch in reader:
+        assert pyarrow.compute.all(pyarrow.compute.equal(batch.column(i), year), min_count=0).as_py()
+        yield pyarrow.RecordBatch.from_arrays(batch.columns[:i] + batch.columns[i+1:], schema=schema)
+
+@log_start_finish
+def _build_pq(year):
+    path = PATH['proc'] / f'{year}'
+    if path.exists(): return
+
+    src = _get_src(year)
+    # write into hidden directory, ignored by dataset reader, and rename when complete
+    tmp = PATH['proc'] / f'.{year}.tmp'
+    shutil.rmtree(tmp, ignore_errors=True)
+    opts = pyarrow.dataset.ParquetFileFormat().make_write_options(compression='zstd', compression_level=3,
+                                                                  use_dictionary=_dict_cols)
+    # archive holds a single CSV file, parsed by pyarrow reader without going through pandas.
+    # file is streamed from the archive and written block by block, so memory use does not grow with file size.
+    # source rows are ordered by area, so row groups within agglvl_code partition have narrow area_fips ranges.
+    with zipfile.ZipFile(src) as zf, zf.open(zf.namelist()[0]) as f:
+        reader = pyarrow.csv.open_csv(f,
+                                      read_options=pyarrow.csv.ReadOptions(block_size=64 << 20),
+                                      convert_options=pyarrow.csv.ConvertOptions(column_types=_schema_parquet,
+                                                                                 strings_can_be_null=True))
+        pyarrow.dataset.write_dataset(_batches_without_year(reader, year), tmp, format='parquet',
+                                      schema=reader.schema.remove(reader.schema.get_field_index('year')),
+                                      partitioning=pyarrow.dataset.partitioning(_partitioning.schema.remove(0)),
+                                      basename_template='part{i}.pq', file_options=opts,
+                                      min_rows_per_group=64_000, max_rows_per_group=256_000)
+    tmp.rename(path)
+
+
+def get_df(years, cols=None, filters=None, dtype_backend=None):
+    # list built year partitions with a single directory scan, instead of checking every year
+    built = {e.name for e in os.scandir(PATH['proc']) if e.is_dir()} if PATH['proc'].exists() else set()
+    missing = [y for y in years if str(y) not in built]
+    if missing:
+        # build missing years concurrently, so that downloads overlap
+        _init_dirs()
+        with concurrent.futures.ThreadPoolExecutor(_DOWNLOAD_WORKERS) as executor:
+            list(executor.map(_build_pq, missing))
     if filters is None:
         filters = []
     filters.append(('year', 'in', years))
@@ -120,10 +160,15 @@ def get_df(years, cols=None, filters=None):
     filters = pyarrow.parquet._filters_to_expression(filters)
         
     ds = pyarrow.dataset.dataset(PATH['proc'], 
-                                 partitioning=pyarrow.dataset.partitioning(field_names=['year']),
+                                 partitioning=_partitioning,
                                  schema=_schema_parquet)
 
-    df = ds.to_table(columns=cols, filter=filters).to_pandas()
+    # filter is pushed down to skip agglvl_code directories and row groups by their statistics
+    scanner = ds.scanner(columns=cols, filter=filters, batch_size=1 << 17, use_threads=True)
+    # table is not used after conversion, so its buffers are released column by column while pandas frame is built.
+    # with dtype_backend='pyarrow', columns stay backed by arrow buffers instead of being copied to numpy.
+    types_mapper = pd.ArrowDtype if dtype_backend == 'pyarrow' else None
+    df = scanner.to_table().to_pandas(types_mapper=types_mapper, split_blocks=True, self_destruct=True)
     return df
 
 def _test_get_df(redownload=False):
@@ -132,6 +177,12 @@ def _test_get_df(redownload=False):
                ['year', 'area_fips', 'annual_avg_estabs', 'oty_annual_avg_estabs_pct_chg', 'disclosure_code'],
                [('agglvl_code', '==', '70')])
     assert len(d) > 0
+    # arrow-backed result holds the same values
+    cols = ['year', 'area_fips', 'annual_avg_estabs']
+    d0 = get_df(range(2019, 2022), cols, [('agglvl_code', '==', '70')])
+    d1 = get_df(range(2019, 2022), cols, [('agglvl_code', '==', '70')], dtype_backend='pyarrow')
+    assert all(isinstance(t, pd.ArrowDtype) for t in d1.dtypes)
+    assert d1.astype(d0.dtypes.to_dict()).equals(d0)
 
 
 def test_all(redownload=False):